@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+months_ordered = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+]
+
+days_in_month = {
+    "January": 31, "February": 28, "March": 31, "April": 30, "May": 31, "June": 30,
+    "July": 31, "August": 31, "September": 30, "October": 31, "November": 30, "December": 31
+}
+
+# Wind speed at pool surface relative to 10 m reference wind speed
+shielding_factors = {
+    "Open exposure (70%) – e.g. Open deck without any obstructions": 0.7,
+    "Partly shielded (40%) – some walls or windbreaks": 0.4,
+    "Recessed or surrounded (15%) – Recessed or large wind breaks": 0.15,
+    "Highly shielded (5%) – Partly enclosed": 0.05
+}
+
+@st.cache_data
+def load_data():
+    """
+    Load the climate data once, with polar GHI outliers cleaned.
+    Returns the dataframe, its lat/lon columns as numpy arrays, and a
+    {month: {parameter: float32 array}} dict of the monthly columns.
+    """
+    df = pd.read_csv("climate_data_sea.csv")
+
+    # Clean polar outliers
+    ghi_cols = df.columns[df.columns.str.startswith("ghi_")]
+    mask = (df['lat'] < -65) | ((df['lat'] > 60) & (df['lon'].between(-60, -20)))
+    df.loc[mask, ghi_cols] *= 0.5
+
+    # Map fields as float32: the data has 3-4 significant digits, and this
+    # halves memory traffic on the map pages
+    climate = {month: {} for month in months_ordered}
+    for col in df.columns.drop(["lat", "lon"]):
+        param, month = col.rsplit("_", 1)
+        climate[month][param] = df[col].to_numpy(dtype=np.float32)
+
+    return df, df["lat"].to_numpy(), df["lon"].to_numpy(), climate
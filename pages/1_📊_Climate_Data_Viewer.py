@@ -1,19 +1,13 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
-from scipy.interpolate import griddata
 import cartopy.crs as ccrs
-import cartopy.feature as cfeature
+from map_utils import interpolate_grid, make_mesh, map_detail_levels, figure_png, add_map_features
+from climate_utils import months_ordered, load_data
 
 st.set_page_config(page_title="Climate Data Viewer", layout="wide")
 st.title("📊 Climate Data Viewer")
 
-@st.cache_data
-def load_data():
-    return pd.read_csv("climate_data_sea.csv")
-
-df = load_data()
+df, lat, lon, climate = load_data()
 
 # Parameter metadata
 parameter_info = {
@@ -28,11 +22,6 @@ parameter_info = {
 }
 available_metrics = list(parameter_info.keys())
 
-# Ordered months
-months_ordered = [
-    "January", "February", "March", "April", "May", "June",
-    "July", "August", "September", "October", "November", "December"
-]
 full_to_short = {
     "January": "jan", "February": "feb", "March": "mar", "April": "apr",
     "May": "may", "June": "jun", "July": "jul", "August": "aug",
@@ -53,6 +42,7 @@ metric = st.sidebar.radio(
     available_metrics,
     format_func=lambda m: parameter_info[m]["label"]
 )
+map_detail = st.sidebar.selectbox("Map detail", list(map_detail_levels))
 
 # Prepare data
 column = f"{metric}_{month}"
@@ -65,37 +55,30 @@ st.subheader(f"{label} — {month} [{unit}]")
 if st.checkbox("Show Raw Data Table"):
     st.dataframe(df[["lat", "lon", column]])
 
-lat = df["lat"].values
-lon = df["lon"].values
-
-ghi_cols = df.columns[df.columns.str.startswith("ghi_")]
-mask = (df['lat'] < -65) | ((df['lat'] > 60) & (df['lon'].between(-60, -20)))
-df.loc[mask, ghi_cols] *= 0.5
-
-data = df[column].values
+data = climate[month][metric]
 
-# Interpolate data
-lon_grid = np.linspace(min(lon), max(lon), 200)
-lat_grid = np.linspace(min(lat), max(lat), 150)
-lon_mesh, lat_mesh = np.meshgrid(lon_grid, lat_grid)
-grid = griddata((lon, lat), data, (lon_mesh, lat_mesh), method='linear')
+@st.cache_data(max_entries=32)
+def plot_field(data, title, unit, map_detail):
+    # Interpolate data
+    lon_mesh, lat_mesh = make_mesh(lon, lat, map_detail)
+    grid = interpolate_grid(lon, lat, data, lon_mesh, lat_mesh)
 
-# Plot map (global extent only)
-fig, ax = plt.subplots(figsize=(10, 6), subplot_kw={'projection': ccrs.PlateCarree()})
-cf = ax.contourf(lon_mesh, lat_mesh, grid, levels=100, cmap="viridis")
+    # Plot map (global extent only)
+    fig, ax = plt.subplots(figsize=(10, 6), subplot_kw={'projection': ccrs.PlateCarree()})
+    cf = ax.pcolormesh(lon_mesh, lat_mesh, grid, cmap="viridis", shading='auto')
 
-# Contour lines
-cs = ax.contour(lon_mesh, lat_mesh, grid, levels=10, colors='black', linewidths=0.5)
-ax.clabel(cs, inline=True, fontsize=8, fmt="%.1f")
+    # Contour lines
+    cs = ax.contour(lon_mesh, lat_mesh, grid, levels=8, colors='black', linewidths=0.5)
+    ax.clabel(cs, inline=True, fontsize=8, fmt="%.1f")
 
-# Add map features
-ax.coastlines()
-ax.add_feature(cfeature.BORDERS, linestyle=':')
-ax.set_title(f"{label} — {month}", fontsize=14)
+    # Add map features
+    add_map_features(ax)
+    ax.set_title(title, fontsize=14)
 
-# Colorbar
-cbar = fig.colorbar(cf, ax=ax, shrink=0.7)
-cbar.set_label(unit)
+    # Colorbar
+    cbar = fig.colorbar(cf, ax=ax, shrink=0.7)
+    cbar.set_label(unit)
+    return figure_png(fig)
 
-# Show plot
-st.pyplot(fig)
+# Show plot (cached as PNG, redrawn only when the field or detail changes)
+st.image(plot_field(data, f"{label} — {month}", unit, map_detail), width="stretch")
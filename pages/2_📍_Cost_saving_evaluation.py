@@ -1,20 +1,23 @@
 
 from heat_loss_utils import compute_heat_losses
+from climate_utils import months_ordered, days_in_month, shielding_factors, load_data
 import streamlit as st
 import pandas as pd
 import numpy as np
 from streamlit_folium import st_folium
 import folium
 import matplotlib.pyplot as plt
+from scipy.spatial import cKDTree
 
 st.set_page_config(page_title="📍 Monthly Ship Location & Energy Savings", layout="wide")
 st.title("📍 Monthly Ship Location & Energy Savings")
 
-@st.cache_data
-def load_data():
-    return pd.read_csv("climate_data_sea.csv")
+df, lat, lon, _ = load_data()
 
-df = load_data()
+@st.cache_resource
+def get_point_tree(lat, lon):
+    """KD-tree over the climate grid points for nearest-point lookups."""
+    return cKDTree(np.column_stack([lat, lon]))
 
 # Sidebar input
 cop = st.sidebar.slider("COP of Electric Heating System", 1.0, 6.0, 3.0)
@@ -29,24 +32,10 @@ night_hours = 12
 cover_used = st.sidebar.checkbox("Use Pool Cover at Night", value=True)
 
 shielding = st.sidebar.selectbox(
-    "Wind speed at pool surface relative to 10 m reference wind speed", [
-        "Open exposure (70%) – e.g. Open deck without any obstructions",
-        "Partly shielded (40%) – some walls or windbreaks",
-        "Recessed or surrounded (15%) – Recessed or large wind breaks",
-        "Highly shielded (5%) – partly enclosed"
-    ]
+    "Wind speed at pool surface relative to 10 m reference wind speed", list(shielding_factors)
 )
-shielding_factor = {
-    "Open exposure (70%) – e.g. Open deck without any obstructions": 0.7,
-    "Partly shielded (40%) – some walls or windbreaks": 0.4,
-    "Recessed or surrounded (15%) – Recessed or large wind breaks": 0.15,
-    "Highly shielded (5%) – partly enclosed": 0.05
-}[shielding]
-
-months_ordered = [
-    "January", "February", "March", "April", "May", "June",
-    "July", "August", "September", "October", "November", "December"
-]
+shielding_factor = shielding_factors[shielding]
+
 short_months = [m[:3].lower() for m in months_ordered]
 
 # Session state initialization
@@ -100,68 +89,65 @@ st.markdown("---")
 st.subheader("📊 Yearly Summary of Energy Use and Savings")
 
 if len(st.session_state.coords_by_month) == 12:
-    results = []
-    days_in_month = {
-        "January": 31, "February": 28, "March": 31, "April": 30, "May": 31, "June": 30,
-        "July": 31, "August": 31, "September": 30, "October": 31, "November": 30, "December": 31
-    }
     hours_day = 24 - night_hours
 
-    for month in months_ordered:
-        short = month[:3].lower()
-        lat_sel, lon_sel = st.session_state.coords_by_month[short]
-        df["dist"] = np.sqrt((df["lat"] - lat_sel)**2 + (df["lon"] - lon_sel)**2)
-        row = df.loc[df["dist"].idxmin()]
-
-        T_min = row[f"tmin_{month}"]
-        T_max = row[f"tmax_{month}"]
-        T_avg = row.get(f"tavg_{month}", (T_min + T_max)/2)
-        T_day = (T_avg + T_max) / 2
-        T_night = (T_avg + T_min) / 2
-        ghi = row[f"ghi_{month}"]
-        wind = row[f"ws10m_{month}"]
-        wind_day = wind * shielding_factor
-        wind_night = 0.8 * wind * shielding_factor
-        rh = row[f"rh_{month}"]
-        rh_day = rh
-        rh_night = 1.1 * rh
-
-        loss = compute_heat_losses(pool_temp, pool_area, pool_depth, T_day, T_night,
-                                   wind_day, wind_night, rh_day, rh_night, night_hours, cover_used)
-
-        Q_day = loss["Q_day"]
-        Q_night = loss["Q_night"]
-        total_loss = Q_day + Q_night
-        days = days_in_month[month]
-
-        helideck_gain = ghi * helideck_area * collector_efficiency
-        pool_solar_gain = ghi * pool_area * 0.7
-        net_pool_heating = max(total_loss - pool_solar_gain, 0)
-        net_saving = min(helideck_gain, net_pool_heating)
-
-        electrical_saving = net_saving * days / cop
-        diesel_kg = electrical_saving * 0.2
-        diesel_liters = diesel_kg / 0.84
-
-        results.append({
-            "Month": month,
-            "Lat": round(lat_sel, 2),
-            "Lon": round(lon_sel, 2),
-            "Daily Loss (kWh)": round(total_loss, 1),
-            "Daily Solar Gain (kWh)": round(helideck_gain, 1),
-            "Daily Net Saving (kWh)": round(net_saving, 1),
-            "Monthly Loss (kWh)": round(total_loss * days, 1),
-            "Monthly Solar Gain (kWh)": round(helideck_gain * days, 1),
-            "Monthly Net Saving (kWh)": round(net_saving * days, 1),
-            "Elec. Saving (kWh)": round(electrical_saving, 1),
-            "Diesel Saved (liters)": round(diesel_liters, 1),
-            "USD Saved": round(diesel_liters * usd_per_liter, 1),
-            "Evaporation (kWh)": round(loss["evap_day"] + loss["evap_night"], 1),
-            "Radiation (kWh)": round(loss["rad_day"] + loss["rad_night"], 1),
-            "Convection (kWh)": round(loss["conv_day"] + loss["conv_night"], 1),
-        })
-
-    df_result = pd.DataFrame(results)
+    # Nearest climate grid point for all 12 months in one query
+    coords = np.array([st.session_state.coords_by_month[month[:3].lower()] for month in months_ordered])
+    _, idx = get_point_tree(lat, lon).query(coords)
+    nearest = df.iloc[idx].to_numpy()
+
+    def monthly_values(param):
+        """Each month's value of `param` taken from that month's nearest grid point."""
+        cols = df.columns.get_indexer([f"{param}_{month}" for month in months_ordered])
+        return nearest[np.arange(len(months_ordered)), cols]
+
+    T_min = monthly_values("tmin")
+    T_max = monthly_values("tmax")
+    T_avg = monthly_values("tavg") if f"tavg_{months_ordered[0]}" in df.columns else (T_min + T_max) / 2
+    T_day = (T_avg + T_max) / 2
+    T_night = (T_avg + T_min) / 2
+    ghi = monthly_values("ghi")
+    wind = monthly_values("ws10m")
+    wind_day = wind * shielding_factor
+    wind_night = 0.8 * wind * shielding_factor
+    rh = monthly_values("rh")
+    rh_day = rh
+    rh_night = 1.1 * rh
+
+    losses = compute_heat_losses(pool_temp, pool_area, pool_depth, T_day, T_night,
+                                 wind_day, wind_night, rh_day, rh_night, night_hours, cover_used)
+
+    Q_day = losses["Q_day"]
+    Q_night = losses["Q_night"]
+    total_loss = Q_day + Q_night
+    days = np.array([days_in_month[month] for month in months_ordered])
+
+    helideck_gain = ghi * helideck_area * collector_efficiency
+    pool_solar_gain = ghi * pool_area * 0.7
+    net_pool_heating = np.clip(total_loss - pool_solar_gain, 0, None)
+    net_saving = np.minimum(helideck_gain, net_pool_heating)
+
+    electrical_saving = net_saving * days / cop
+    diesel_kg = electrical_saving * 0.2
+    diesel_liters = diesel_kg / 0.84
+
+    df_result = pd.DataFrame({
+        "Month": months_ordered,
+        "Lat": np.round(coords[:, 0], 2),
+        "Lon": np.round(coords[:, 1], 2),
+        "Daily Loss (kWh)": np.round(total_loss, 1),
+        "Daily Solar Gain (kWh)": np.round(helideck_gain, 1),
+        "Daily Net Saving (kWh)": np.round(net_saving, 1),
+        "Monthly Loss (kWh)": np.round(total_loss * days, 1),
+        "Monthly Solar Gain (kWh)": np.round(helideck_gain * days, 1),
+        "Monthly Net Saving (kWh)": np.round(net_saving * days, 1),
+        "Elec. Saving (kWh)": np.round(electrical_saving, 1),
+        "Diesel Saved (liters)": np.round(diesel_liters, 1),
+        "USD Saved": np.round(diesel_liters * usd_per_liter, 1),
+        "Evaporation (kWh)": np.round(losses["evap_day"] + losses["evap_night"], 1),
+        "Radiation (kWh)": np.round(losses["rad_day"] + losses["rad_night"], 1),
+        "Convection (kWh)": np.round(losses["conv_day"] + losses["conv_night"], 1),
+    })
     totals = df_result[[
         "Monthly Loss (kWh)", "Monthly Solar Gain (kWh)", "Monthly Net Saving (kWh)",
         "Elec. Saving (kWh)", "Diesel Saved (liters)", "USD Saved"